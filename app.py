@@ -1,9 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, render_template, request, jsonify
-from src.analyzer import analyze_password, get_strength_label, check_pwned_password
+from src.analyzer import (analyze_password, get_strength_label, check_pwned_password,
+                          load_bloom_filter)
 from src.generator import generate_password
 
 app = Flask(__name__)
 
+# Map in the optional breach pre-filter at startup rather than in the first request
+load_bloom_filter()
+
+# Runs breach checks (network-bound) alongside the CPU-bound analysis
+_executor = ThreadPoolExecutor(max_workers=8)
+
 @app.route('/')
 def index():
     """Serve the main page"""
@@ -18,12 +26,15 @@ def analyze():
     if not password:
         return jsonify({'error': 'No password provided'}), 400
     
+    # Start the breach check so it overlaps with the strength analysis
+    breach_check = _executor.submit(check_pwned_password, password)
+    
     # Analyze the password
     results = analyze_password(password)
     strength = get_strength_label(results['score'])
     
     # Check if breached
-    is_pwned, count = check_pwned_password(password)
+    is_pwned, count = breach_check.result()
     
     return jsonify({
         'length': results['length'],
@@ -1,17 +1,101 @@
-import re
 import hashlib
-import requests
-from zxcvbn import zxcvbn
+import os
+import re
+import threading
+
+# Imported as src.cache by the app and tests, and as cache when this file is
+# run directly
+try:
+    from src.bloom_filter import BloomFilter
+    from src.cache import DigestCache, LRUCache
+except ImportError:
+    from bloom_filter import BloomFilter
+    from cache import DigestCache, LRUCache
+
+# Character class bits
+_LOWER = 1 << 0
+_UPPER = 1 << 1
+_DIGIT = 1 << 2
+_SPECIAL = 1 << 3
+
+# Characters counted as special
+_SPECIAL_CHARACTERS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+# Byte -> class bit lookup, so one pass over the password finds every class
+_CLASS_TABLE = bytearray(256)
+for _c in range(ord('a'), ord('z') + 1):
+    _CLASS_TABLE[_c] = _LOWER
+for _c in range(ord('A'), ord('Z') + 1):
+    _CLASS_TABLE[_c] = _UPPER
+for _c in range(ord('0'), ord('9') + 1):
+    _CLASS_TABLE[_c] = _DIGIT
+for _c in _SPECIAL_CHARACTERS:
+    _CLASS_TABLE[ord(_c)] = _SPECIAL
+del _c
+
+# zxcvbn's matching is quadratic in password length, so only this many
+# characters are passed to it to keep long inputs from tying up a worker
+_ZXCVBN_MAX_LENGTH = 100
+
+# zxcvbn loads large word lists on import, so it is only imported on first use.
+# The Rust port (zxcvbn-rs-py) is preferred when installed; it is much faster
+# than the pure-Python package, which is used as the fallback.
+_zxcvbn = None
+
+def _get_zxcvbn():
+    """Return the zxcvbn function, importing it on first call"""
+    global _zxcvbn
+    if _zxcvbn is None:
+        try:
+            from zxcvbn_rs_py import zxcvbn
+        except ImportError:
+            from zxcvbn import zxcvbn
+        _zxcvbn = zxcvbn
+    return _zxcvbn
+
+def _zxcvbn_summary(result):
+    """Return (score, crack time display) from either zxcvbn result type"""
+    # The Python package returns a dict, the Rust port an object with attributes
+    if isinstance(result, dict):
+        return (result['score'],
+                result['crack_times_display']['offline_slow_hashing_1e4_per_second'])
+    return (int(result.score),
+            str(result.crack_times_display.offline_slow_hashing_1e4_per_second))
+
+# Optional LRU cache of analysis results for repeated inputs, such as a live
+# strength meter re-submitting as the user types. Off unless
+# ANALYSIS_CACHE_SIZE is set. Entries are keyed by a salted digest, so
+# plaintext passwords are never retained.
+_analysis_cache = DigestCache(int(os.environ.get('ANALYSIS_CACHE_SIZE', '0')))
 
 def analyze_password(password):
     """Analyze password strength and return results"""
+    if not _analysis_cache.maxsize:
+        return _analyze_password(password)
+    
+    results = _analysis_cache.get(password)
+    if results is None:
+        results = _analyze_password(password)
+        _analysis_cache.put(password, results)
+    
+    # Callers get their own copy so they cannot alter the cached entry
+    return dict(results)
+
+def _analyze_password(password):
+    """Compute the strength analysis for analyze_password"""
     
     # Basic checks
     length = len(password)
-    has_upper = bool(re.search(r'[A-Z]', password))
-    has_lower = bool(re.search(r'[a-z]', password))
-    has_digit = bool(re.search(r'\d', password))
-    has_special = bool(re.search(r'[!@#$%^&*(),.?":{}|<>]', password))
+    flags = 0
+    # translate() maps every byte to its class bit in C; the set collapses the
+    # result to the few distinct values before OR-ing them together. Non-ASCII
+    # characters, including lone surrogates from JSON input, map to no class.
+    for bits in set(password.encode('utf-8', 'surrogatepass').translate(_CLASS_TABLE)):
+        flags |= bits
+    has_upper = bool(flags & _UPPER)
+    has_lower = bool(flags & _LOWER)
+    has_digit = bool(flags & _DIGIT)
+    has_special = bool(flags & _SPECIAL)
     
     # Calculate score
     score = 0
@@ -28,8 +112,9 @@ def analyze_password(password):
     if has_special:
         score += 1
     
-    # Use zxcvbn for entropy analysis
-    result = zxcvbn(password)
+    # Use zxcvbn for entropy analysis (on a bounded prefix, see above)
+    result = _get_zxcvbn()(password[:_ZXCVBN_MAX_LENGTH])
+    entropy_score, crack_time = _zxcvbn_summary(result)
     
     return {
         'length': length,
@@ -38,8 +123,8 @@ def analyze_password(password):
         'has_digits': has_digit,
         'has_special': has_special,
         'score': score,
-        'entropy_score': result['score'],  # 0-4 scale
-        'crack_time': result['crack_times_display']['offline_slow_hashing_1e4_per_second']
+        'entropy_score': entropy_score,  # 0-4 scale
+        'crack_time': crack_time
     }
 
 def get_strength_label(score):
@@ -51,35 +136,132 @@ def get_strength_label(score):
     else:
         return "Strong"
 
+# Shared HTTP session so breach checks reuse kept-alive TLS connections,
+# created (along with the requests import) on the first breach check
+_session = None
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first call"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.headers['User-Agent'] = 'pw-analyzer'
+        session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        _session = session
+    return _session
+
+# (connect, read) timeouts in seconds for breach database requests
+_HIBP_TIMEOUT = (2, 5)
+
+# Recently fetched ranges. A parsed range takes roughly 100 KB, so the cache
+# is kept small (HIBP_RANGE_CACHE_SIZE, default 256), and entries expire after
+# HIBP_RANGE_CACHE_TTL seconds (default one hour) so newly breached passwords
+# are picked up.
+_range_cache = LRUCache(int(os.environ.get('HIBP_RANGE_CACHE_SIZE', '256')),
+                        ttl=float(os.environ.get('HIBP_RANGE_CACHE_TTL', '3600')))
+
+def _fetch_range(prefix):
+    """Return the parsed HaveIBeenPwned range for a 5-char hash prefix"""
+    counts = _range_cache.get(prefix)
+    if counts is None:
+        counts = _download_range(prefix)
+        _range_cache.put(prefix, counts)
+    return counts
+
+# A range line: 35 hex digits of hash suffix and a breach count (lowercased)
+_RANGE_LINE_RE = re.compile(rb'([0-9a-f]{35}):(\d+)')
+
+def _download_range(prefix):
+    """Fetch and parse the HaveIBeenPwned range for a 5-char hash prefix"""
+    import requests
+    url = f'https://api.pwnedpasswords.com/range/{prefix.upper()}'
+    
+    # Map each hash suffix to its breach count for O(1) lookups, parsing lines
+    # as they stream in. The API serves uppercase hex; keys are lowercased to
+    # match hexdigest() directly. Malformed lines are skipped.
+    counts = {}
+    with _get_session().get(url, stream=True, timeout=_HIBP_TIMEOUT) as response:
+        if response.status_code != 200:
+            raise requests.HTTPError(f'Unexpected status {response.status_code}',
+                                     response=response)
+        for line in response.iter_lines():
+            match = _RANGE_LINE_RE.fullmatch(line.strip().lower())
+            if match:
+                counts[match.group(1).decode('ascii')] = int(match.group(2))
+    
+    # Every real range has hundreds of entries; an empty one means the body
+    # was not a range, and must not be cached as "nothing breached"
+    if not counts:
+        raise requests.HTTPError('Empty breach range', response=response)
+    return counts
+
+# Optional local breach pre-filter. If HIBP_BLOOM_FILTER names a filter saved
+# by BloomFilter.save(), passwords the filter rules out skip the API call.
+# Build it from the full Pwned Passwords list: any password missing from it
+# would otherwise be reported as not breached.
+_bloom_filter = None
+_bloom_filter_loaded = False
+_bloom_filter_lock = threading.Lock()
+
+def load_bloom_filter():
+    """Return the breach pre-filter, mapping it in on first call (None if unset)"""
+    global _bloom_filter, _bloom_filter_loaded
+    if not _bloom_filter_loaded:
+        with _bloom_filter_lock:
+            if not _bloom_filter_loaded:
+                path = os.environ.get('HIBP_BLOOM_FILTER')
+                if path:
+                    _bloom_filter = BloomFilter.load(path)
+                _bloom_filter_loaded = True
+    return _bloom_filter
+
+# Recent full hashes confirmed as breached, mapped to their breach count.
+# A pwned password stays pwned, so these entries never expire.
+_pwned_hashes = LRUCache(4096)
+
 def check_pwned_password(password):
     """Check if password has been in a data breach using HaveIBeenPwned API"""
+    import requests
+    
+    # Breached passwords are hashed as UTF-8, which lone surrogates have none of
+    try:
+        encoded = password.encode('utf-8')
+    except UnicodeEncodeError:
+        return None, "Could not check breach database"
     
-    # Hash the password with SHA-1
-    sha1_password = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+    # Hash the password with SHA-1 (hashlib uses OpenSSL, which picks up the
+    # CPU's SHA extensions where available)
+    digest = hashlib.sha1(encoded).digest()
+    sha1_password = digest.hex()
+    
+    count = _pwned_hashes.get(sha1_password)
+    if count is not None:
+        return True, count
+    
+    # Skip the network entirely if the local pre-filter rules the hash out
+    bloom_filter = load_bloom_filter()
+    if bloom_filter is not None and digest not in bloom_filter:
+        return False, 0
     
     # Split into first 5 chars and rest
     first5, tail = sha1_password[:5], sha1_password[5:]
     
-    # Query the API with first 5 characters
-    url = f'https://api.pwnedpasswords.com/range/{first5}'
-    
     try:
-        response = requests.get(url)
-        
-        if response.status_code != 200:
-            return None, "Could not check breach database"
-        
-        # Check if our hash suffix appears in the response
-        hashes = (line.split(':') for line in response.text.splitlines())
-        
-        for hash_suffix, count in hashes:
-            if hash_suffix == tail:
-                return True, int(count)
-        
-        return False, 0
-        
+        # Query the API with first 5 characters (cached per prefix)
+        count = _fetch_range(first5).get(tail)
+    except requests.HTTPError:
+        return None, "Could not check breach database"
     except requests.RequestException:
         return None, "Error connecting to breach database"
+    
+    # Padded responses list unbreached suffixes with a count of 0
+    if not count:
+        return False, 0
+    
+    _pwned_hashes.put(sha1_password, count)
+    return True, count
 
 # Test it
 if __name__ == "__main__":
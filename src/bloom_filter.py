@@ -0,0 +1,163 @@
+"""
+Bloom Filter Module
+
+This module provides a compact, probabilistic set of SHA-1 password hashes.
+It is used as a local front-end to the breach database: a Bloom filter can
+report false positives but never false negatives, so a password it rules out
+is definitely not in the corpus it was built from.
+
+Build a filter file once, offline, from a file of raw SHA-1 digests:
+
+    python -m src.bloom_filter digests.bin breach.bloom
+
+The saved file is memory-mapped on load, so opening it is instant and its
+pages are shared between worker processes.
+"""
+
+import math
+import mmap
+import os
+import struct
+import sys
+from typing import Iterator
+
+# Saved filter layout: magic, size in bits, hash count, then the bit array
+_MAGIC = b'PWBF'
+_HEADER = struct.Struct('>4sQI')
+
+
+class BloomFilter:
+    """
+    Bloom filter keyed by SHA-1 digests.
+    
+    SHA-1 output is already uniformly distributed, so bit positions are derived
+    from two 64-bit slices of the digest by double hashing instead of running
+    a separate hash function per position. 64-bit slices keep every position
+    reachable even when the filter has more than 2**32 bits.
+    """
+    
+    DIGEST_SIZE = 20  # Bytes in a SHA-1 digest
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Create an empty filter sized for the expected number of entries.
+        
+        Args:
+            capacity (int): Expected number of digests to be added
+            error_rate (float): Target false positive rate
+        """
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, digest: bytes) -> Iterator[int]:
+        """
+        Compute the bit positions for a digest.
+        
+        Args:
+            digest (bytes): SHA-1 digest (only the first 16 bytes are used)
+        
+        Returns:
+            iterator: Bit positions in the filter
+        """
+        first = int.from_bytes(digest[:8], 'big')
+        step = int.from_bytes(digest[8:16], 'big') | 1
+        return ((first + i * step) % self.size for i in range(self.hash_count))
+    
+    def add(self, digest: bytes) -> None:
+        """
+        Add a SHA-1 digest to the filter.
+        
+        Args:
+            digest (bytes): SHA-1 digest to add
+        """
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, digest: bytes) -> bool:
+        """
+        Check whether a digest may be in the filter.
+        
+        Args:
+            digest (bytes): SHA-1 digest to check
+        
+        Returns:
+            bool: False if definitely absent, True if possibly present
+        """
+        return all(self.bits[position >> 3] >> (position & 7) & 1
+                   for position in self._positions(digest))
+    
+    @classmethod
+    def from_digest_file(cls, path: str, error_rate: float = 0.01) -> 'BloomFilter':
+        """
+        Build a filter from a file of concatenated raw 20-byte SHA-1 digests.
+        
+        This adds every digest in Python, so it is meant for building a filter
+        offline; save() the result and load() it at run time.
+        
+        Args:
+            path (str): Path to the digest file
+            error_rate (float): Target false positive rate
+        
+        Returns:
+            BloomFilter: Filter containing every digest in the file
+        """
+        bloom = cls(os.path.getsize(path) // cls.DIGEST_SIZE, error_rate)
+        
+        with open(path, 'rb') as digest_file:
+            while True:
+                chunk = digest_file.read(cls.DIGEST_SIZE * 65536)
+                if not chunk:
+                    break
+                for start in range(0, len(chunk) - cls.DIGEST_SIZE + 1, cls.DIGEST_SIZE):
+                    bloom.add(chunk[start:start + cls.DIGEST_SIZE])
+        
+        return bloom
+    
+    def save(self, path: str) -> None:
+        """
+        Write the filter to a file that load() can map back in.
+        
+        Args:
+            path (str): Path to write
+        """
+        with open(path, 'wb') as filter_file:
+            filter_file.write(_HEADER.pack(_MAGIC, self.size, self.hash_count))
+            filter_file.write(self.bits)
+    
+    @classmethod
+    def load(cls, path: str) -> 'BloomFilter':
+        """
+        Memory-map a filter written by save(). The result is read-only.
+        
+        Args:
+            path (str): Path to the saved filter
+        
+        Returns:
+            BloomFilter: Filter backed by the mapped file
+        
+        Raises:
+            ValueError: If the file is not a saved filter
+        """
+        with open(path, 'rb') as filter_file:
+            mapped = mmap.mmap(filter_file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, size, hash_count = None, 0, 0
+        if len(mapped) >= _HEADER.size:
+            magic, size, hash_count = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC or len(mapped) != _HEADER.size + (size + 7) // 8:
+            mapped.close()
+            raise ValueError(f"{path} is not a saved Bloom filter")
+        
+        bloom = cls.__new__(cls)
+        bloom.size = size
+        bloom.hash_count = hash_count
+        bloom.bits = memoryview(mapped)[_HEADER.size:]
+        return bloom
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m src.bloom_filter DIGEST_FILE OUTPUT_FILE")
+    BloomFilter.from_digest_file(sys.argv[1]).save(sys.argv[2])
@@ -0,0 +1,130 @@
+"""
+Cache Module
+
+This module provides a small thread-safe LRU cache with an optional
+time-to-live, used to bound the in-memory caches of the breach checker, and
+a variant keyed by password digests for caching analysis results.
+"""
+
+import hashlib
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Least-recently-used cache holding at most maxsize entries.
+    
+    Entries older than ttl seconds (if set) are treated as missing. A maxsize
+    of 0 disables the cache: nothing is stored.
+    """
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """
+        Create an empty cache.
+        
+        Args:
+            maxsize (int): Maximum number of entries kept
+            ttl (float): Seconds an entry stays valid, or None for no expiry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key, marking it as recently used.
+        
+        Args:
+            key: Key to look up
+            default: Value returned if the key is missing or expired
+        
+        Returns:
+            The cached value, or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+        
+        Args:
+            key: Key to store under
+            value: Value to store
+        """
+        if self.maxsize <= 0:
+            return
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DigestCache(LRUCache):
+    """
+    LRU cache keyed by passwords that never stores the passwords themselves.
+    
+    Keys are BLAKE2 digests under a random per-instance key, so cached entries
+    cannot be matched against precomputed hashes.
+    """
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """
+        Create an empty cache.
+        
+        Args:
+            maxsize (int): Maximum number of entries kept
+            ttl (float): Seconds an entry stays valid, or None for no expiry
+        """
+        super().__init__(maxsize, ttl)
+        self._digest_key = secrets.token_bytes(16)
+    
+    def _digest(self, password: str) -> bytes:
+        return hashlib.blake2b(password.encode('utf-8', 'surrogatepass'),
+                               key=self._digest_key, digest_size=16).digest()
+    
+    def get(self, password: str, default: Any = None) -> Any:
+        """
+        Look up a password, marking it as recently used.
+        
+        Args:
+            password (str): Password to look up
+            default: Value returned if the password is missing or expired
+        
+        Returns:
+            The cached value, or default
+        """
+        return super().get(self._digest(password), default)
+    
+    def put(self, password: str, value: Any) -> None:
+        """
+        Store a value for a password.
+        
+        Args:
+            password (str): Password to store under
+            value: Value to store
+        """
+        super().put(self._digest(password), value)
@@ -7,10 +7,76 @@ Entropy is measured in bits and represents the unpredictability of a password.
 Higher entropy = harder to crack through brute force attacks.
 """
 
+import bisect
+import itertools
 import math
-import re
+import string
+import sys
 from typing import Dict, List, Tuple
-from collections import Counter
+from collections import Counter, deque
+
+
+# Character classes used for pool size detection (set tests run in C)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_ALPHANUMERIC = _LOWERCASE | _UPPERCASE | _DIGITS
+
+# Seconds in a (365-day) year
+_YEAR = 31536000
+
+# (lower bound in seconds, unit in seconds, scale, format) for each
+# human-readable time unit, in ascending order; anything below the first bound
+# is "Instant". Values are shown as seconds / unit / scale.
+_TIME_UNITS = (
+    (1, 1, 1, "{:.1f} seconds"),
+    (60, 60, 1, "{:.1f} minutes"),
+    (3600, 3600, 1, "{:.1f} hours"),
+    (86400, 86400, 1, "{:.1f} days"),
+    (_YEAR, _YEAR, 1, "{:.1f} years"),
+    (_YEAR * 100, _YEAR, 1, "{:.0f} years"),
+    (_YEAR * 1000, _YEAR, 1000, "{:.1f} thousand years"),
+    (_YEAR * 1_000_000, _YEAR, 1_000_000, "{:.1f} million years"),
+    (_YEAR * 1_000_000_000, _YEAR, 1_000_000_000, "{:.1f} billion years"),
+)
+_TIME_THRESHOLDS = tuple(unit[0] for unit in _TIME_UNITS)
+
+# Times from a million billion years up are shown in scientific notation
+_SCIENTIFIC_TIME_THRESHOLD = _YEAR * 1e15
+
+
+def _format_scientific(log10_value: float) -> str:
+    """
+    Format 10 ** log10_value in scientific notation without computing the value.
+    
+    Keeps huge combination counts (e.g. 94^128) out of bignum arithmetic.
+    
+    Args:
+        log10_value (float): Base-10 logarithm of the number to format
+        
+    Returns:
+        str: Number formatted like f"{value:.2e}"
+    """
+    exponent = math.floor(log10_value)
+    mantissa = round(10 ** (log10_value - exponent), 2)
+    if mantissa >= 10:
+        mantissa /= 10
+        exponent += 1
+    return f"{mantissa:.2f}e{exponent:+03d}"
+
+
+def _format_huge_time(log2_seconds: float) -> str:
+    """
+    Format a time too large for fixed-point display, in the largest unit.
+    
+    Args:
+        log2_seconds (float): Base-2 logarithm of the time in seconds
+        
+    Returns:
+        str: Time in billions of years, in scientific notation
+    """
+    log10_billion_years = log2_seconds * math.log10(2) - math.log10(_YEAR * 1_000_000_000)
+    return f"{_format_scientific(log10_billion_years)} billion years"
 
 
 class EntropyCalculator:
@@ -19,6 +85,9 @@ class EntropyCalculator:
     
     Entropy is calculated based on the character pool size and password length.
     Formula: Entropy = log2(pool_size ^ length)
+    
+    Instances are safe to share between threads: the only mutable state is the
+    bounded calculation history, and deque appends are atomic.
     """
     
     # Character pool sizes
@@ -27,9 +96,20 @@ class EntropyCalculator:
     DIGITS_POOL = 10
     SPECIAL_POOL = 32  # Common special characters
     
+    # Number of recent analyses kept in calculation_history
+    HISTORY_SIZE = 1000
+    
+    # log2 of every reachable pool size (sums of any non-empty set of pools)
+    _LOG2_POOL = {
+        sum(pools): math.log2(sum(pools))
+        for pools in itertools.product((0, LOWERCASE_POOL), (0, UPPERCASE_POOL),
+                                       (0, DIGITS_POOL), (0, SPECIAL_POOL))
+        if any(pools)
+    }
+    
     def __init__(self):
         """Initialize the entropy calculator"""
-        self.calculation_history = []
+        self.calculation_history = deque(maxlen=self.HISTORY_SIZE)
     
     def calculate_shannon_entropy(self, password: str) -> float:
         """
@@ -56,11 +136,11 @@ class EntropyCalculator:
         length = len(password)
         frequencies = Counter(password)
         
-        # Calculate Shannon entropy
-        entropy = 0.0
-        for count in frequencies.values():
-            probability = count / length
-            entropy -= probability * math.log2(probability)
+        # Shannon entropy, H = log2(n) - sum(c * log2(c)) / n, which avoids a
+        # division and a probability log per distinct character
+        entropy = math.log2(length) - sum(
+            count * math.log2(count) for count in frequencies.values()
+        ) / length
         
         return round(entropy, 2)
     
@@ -78,7 +158,7 @@ class EntropyCalculator:
             dict: Dictionary containing:
                 - pool_size: Number of possible characters
                 - entropy_bits: Entropy in bits
-                - combinations: Total possible combinations
+                - combinations: Total possible combinations (scientific notation)
                 
         Example:
             >>> calc = EntropyCalculator()
@@ -90,17 +170,17 @@ class EntropyCalculator:
             return {
                 'pool_size': 0,
                 'entropy_bits': 0.0,
-                'combinations': 0
+                'combinations': f"{0:.2e}"
             }
         
         pool_size = self._calculate_pool_size(password)
         length = len(password)
         
         # Calculate entropy: log2(pool_size ^ length)
-        entropy_bits = length * math.log2(pool_size)
+        entropy_bits = length * self._LOG2_POOL[pool_size]
         
-        # Calculate total combinations
-        combinations = pool_size ** length
+        # Total combinations (pool_size ^ length), formatted from its logarithm
+        combinations = _format_scientific(length * math.log10(pool_size))
         
         return {
             'pool_size': pool_size,
@@ -122,19 +202,19 @@ class EntropyCalculator:
         pool_size = 0
         
         # Check for lowercase letters
-        if re.search(r'[a-z]', password):
+        if not _LOWERCASE.isdisjoint(password):
             pool_size += self.LOWERCASE_POOL
         
         # Check for uppercase letters
-        if re.search(r'[A-Z]', password):
+        if not _UPPERCASE.isdisjoint(password):
             pool_size += self.UPPERCASE_POOL
         
         # Check for digits
-        if re.search(r'\d', password):
+        if not _DIGITS.isdisjoint(password):
             pool_size += self.DIGITS_POOL
         
         # Check for special characters
-        if re.search(r'[^a-zA-Z0-9]', password):
+        if not _ALPHANUMERIC.issuperset(password):
             pool_size += self.SPECIAL_POOL
         
         return pool_size
@@ -158,7 +238,7 @@ class EntropyCalculator:
         else:
             pool_size = self.LOWERCASE_POOL + self.UPPERCASE_POOL
         
-        ideal_entropy = length * math.log2(pool_size)
+        ideal_entropy = length * self._LOG2_POOL[pool_size]
         return round(ideal_entropy, 2)
     
     def get_entropy_strength(self, entropy_bits: float) -> str:
@@ -201,19 +281,26 @@ class EntropyCalculator:
         Returns:
             dict: Time estimates for different scenarios
         """
-        # Calculate total possible combinations
-        total_combinations = 2 ** entropy_bits
-        
-        # Average time to crack (on average, 50% of combinations need to be tried)
-        average_seconds = (total_combinations / 2) / guesses_per_second
-        
-        # Worst case (100% of combinations)
-        worst_seconds = total_combinations / guesses_per_second
+        if entropy_bits < sys.float_info.max_exp:
+            # Calculate total possible combinations
+            total_combinations = 2 ** entropy_bits
+            
+            # Average time to crack (on average, 50% of combinations need to be tried)
+            average_case = self._format_time((total_combinations / 2) / guesses_per_second)
+            
+            # Worst case (100% of combinations)
+            worst_case = self._format_time(total_combinations / guesses_per_second)
+        else:
+            # 2 ** entropy_bits would overflow a float, so work with logarithms;
+            # these times are past the scientific notation threshold anyway
+            log2_worst_seconds = entropy_bits - math.log2(guesses_per_second)
+            average_case = _format_huge_time(log2_worst_seconds - 1)
+            worst_case = _format_huge_time(log2_worst_seconds)
         
         return {
-            'average_case': self._format_time(average_seconds),
-            'worst_case': self._format_time(worst_seconds),
-            'combinations': f"{total_combinations:.2e}",
+            'average_case': average_case,
+            'worst_case': worst_case,
+            'combinations': _format_scientific(entropy_bits * math.log10(2)),
             'attack_speed': f"{guesses_per_second:,} guesses/second"
         }
     
@@ -227,34 +314,15 @@ class EntropyCalculator:
         Returns:
             str: Formatted time string
         """
-        if seconds < 1:
+        if seconds >= _SCIENTIFIC_TIME_THRESHOLD:
+            return _format_huge_time(math.log2(seconds))
+        
+        index = bisect.bisect_right(_TIME_THRESHOLDS, seconds)
+        if index == 0:
             return "Instant"
-        elif seconds < 60:
-            return f"{seconds:.1f} seconds"
-        elif seconds < 3600:
-            minutes = seconds / 60
-            return f"{minutes:.1f} minutes"
-        elif seconds < 86400:
-            hours = seconds / 3600
-            return f"{hours:.1f} hours"
-        elif seconds < 31536000:
-            days = seconds / 86400
-            return f"{days:.1f} days"
-        elif seconds < 31536000 * 100:
-            years = seconds / 31536000
-            return f"{years:.1f} years"
-        elif seconds < 31536000 * 1000:
-            years = seconds / 31536000
-            return f"{years:.0f} years"
-        elif seconds < 31536000 * 1_000_000:
-            years = seconds / 31536000
-            return f"{years/1000:.1f} thousand years"
-        elif seconds < 31536000 * 1_000_000_000:
-            years = seconds / 31536000
-            return f"{years/1_000_000:.1f} million years"
-        else:
-            years = seconds / 31536000
-            return f"{years/1_000_000_000:.1f} billion years"
+        
+        _, unit, scale, template = _TIME_UNITS[index - 1]
+        return template.format(seconds / unit / scale)
     
     def analyze_complete(self, password: str) -> Dict:
         """
@@ -287,7 +355,7 @@ class EntropyCalculator:
             'total_combinations': password_entropy['combinations']
         }
         
-        # Store in history
+        # Store in history (oldest entries are evicted once full)
         self.calculation_history.append({
             'password_length': len(password),
             'entropy': password_entropy['entropy_bits'],
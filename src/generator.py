@@ -1,30 +1,37 @@
 import secrets
 import string
 
+# Character pools for every combination of options, indexed by a bit mask
+# (lowercase=1, uppercase=2, digits=4, special=8) and stored as bytes
+_CHARACTER_SETS = (string.ascii_lowercase, string.ascii_uppercase,
+                   string.digits, string.punctuation)
+_POOLS = tuple(
+    ''.join(chars for bit, chars in enumerate(_CHARACTER_SETS) if mask >> bit & 1).encode()
+    for mask in range(16)
+)
+
 def generate_password(length=16, use_uppercase=True, use_lowercase=True, 
                      use_digits=True, use_special=True):
     """Generate a cryptographically secure random password"""
     
-    # Build character pool based on options
-    characters = ""
-    
-    if use_lowercase:
-        characters += string.ascii_lowercase
-    if use_uppercase:
-        characters += string.ascii_uppercase
-    if use_digits:
-        characters += string.digits
-    if use_special:
-        characters += string.punctuation
+    # Look up the character pool for the selected options
+    mask = (bool(use_lowercase) | bool(use_uppercase) << 1 |
+            bool(use_digits) << 2 | bool(use_special) << 3)
     
     # If no character types selected, default to all
-    if not characters:
-        characters = string.ascii_letters + string.digits + string.punctuation
-    
-    # Generate password using secrets (cryptographically secure)
-    password = ''.join(secrets.choice(characters) for _ in range(length))
-    
-    return password
+    pool = _POOLS[mask] or _POOLS[15]
+    
+    # Generate password from bulk random bytes (cryptographically secure).
+    # Bytes at or above the cutoff are rejected so every character stays
+    # equally likely despite the modulo mapping.
+    pool_size = len(pool)
+    cutoff = 256 - (256 % pool_size)
+    password = bytearray()
+    while len(password) < length:
+        random_bytes = secrets.token_bytes((length - len(password)) * 2)
+        password.extend(pool[b % pool_size] for b in random_bytes if b < cutoff)
+    
+    return password[:length].decode()
 
 def generate_multiple_passwords(count=5, length=16):
     """Generate multiple password options"""
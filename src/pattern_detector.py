@@ -13,10 +13,338 @@ Patterns detected:
 - Common word patterns
 """
 
+import operator
+import os
 import re
-from typing import Dict, List, Tuple, Set
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Set
 from datetime import datetime
 
+# Imported as src.cache by the app and tests, and as cache when this file is
+# run directly
+try:
+    from src.cache import DigestCache
+except ImportError:
+    from cache import DigestCache
+
+
+class _Automaton:
+    """
+    Aho-Corasick automaton for finding many substrings in a single pass.
+    
+    Follows the add_word / make_automaton / iter interface of pyahocorasick,
+    so matching a password against every pattern costs one scan of the
+    password instead of one substring search per pattern.
+    """
+    
+    def __init__(self):
+        """Initialize an empty automaton (only the root state)"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [()]
+    
+    def add_word(self, word: str, value) -> None:
+        """
+        Add a pattern to the automaton.
+        
+        Args:
+            word (str): Pattern to match
+            value: Value reported when the pattern is found (replaces any
+                previous value for the same word)
+        """
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(())
+            state = next_state
+        self._outputs[state] = (value,)
+    
+    def make_automaton(self) -> None:
+        """Compute failure links and merged outputs; call after adding words"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._outputs[next_state] += self._outputs[self._fail[next_state]]
+                queue.append(next_state)
+    
+    def iter(self, text: str):
+        """
+        Find every pattern occurrence in text.
+        
+        Args:
+            text (str): Text to scan
+            
+        Yields:
+            tuple: (end index, value) for each occurrence, by end index
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for value in outputs[state]:
+                yield index, value
+
+
+# Four-digit years (1900-2099)
+_YEAR_RE = re.compile(r'(19\d{2}|20\d{2})')
+
+# Full date formats
+_FULL_DATE_RES = (
+    re.compile(r'(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])(19|20)\d{2}'),  # MMDDYYYY
+    re.compile(r'(0[1-9]|[12]\d|3[01])(0[1-9]|1[0-2])(19|20)\d{2}'),  # DDMMYYYY
+)
+
+# Common leet substitutes, and the letter each one stands in for when scoring
+_LEET_RE = re.compile(r'[4@31!05$]')
+_LEET_LETTERS = {
+    '4': 'a', '@': 'a',  # a -> 4/@
+    '3': 'e',            # e -> 3
+    '1': 'i', '!': 'i',  # i -> 1/!
+    '0': 'o',            # o -> 0
+    '5': 's', '$': 's',  # s -> 5/$
+}
+
+# Runs of three or more of the same character
+_CHARACTER_RUN_RE = re.compile(r'(.)\1{2,}', re.DOTALL)
+
+# Translation table mapping every non-digit ASCII character to NUL
+_ASCII_DIGITS_ONLY = {code: 0 for code in range(128) if not chr(code).isdigit()}
+
+# Pattern log categories. Detectors log (category, *args) tuples, and the
+# descriptions are only formatted when detected_patterns is read.
+(_KEYBOARD_ROW, _KEYBOARD_WALK, _ALPHABETIC_SEQUENCE, _REVERSE_ALPHABETIC,
+ _NUMERIC_SEQUENCE, _REVERSE_NUMERIC, _REPEATED_CHARACTER, _REPEATED_SEQUENCE,
+ _LEET_SPEAK, _YEAR, _FULL_DATE, _COMMON_WORD, _COMMON_STRUCTURE,
+ _DESCRIPTION) = range(14)
+
+_PATTERN_LABELS = (
+    "Keyboard row: {}",
+    "Keyboard walk: {}",
+    "Alphabetic sequence: {}",
+    "Reverse alphabetic: {}",
+    "Numeric sequence: {}",
+    "Reverse numeric: {}",
+    "Repeated character: '{}' x{}",
+    "Repeated sequence: '{}' x{}",
+    "Uses leetspeak substitutions",
+    "Year detected: {}",
+    "Date pattern: {}",
+    "Common word: {}",
+    "Follows common structure: Upper+lower+digits/special",
+    "{}",  # Description assigned directly to detected_patterns
+)
+
+
+def _character_class(char: str) -> str:
+    """
+    Classify a character for analyze_character_patterns.
+    
+    Args:
+        char (str): Character to classify
+        
+    Returns:
+        str: 'd' digit, 'u' uppercase, 'l' lowercase, 'a' other alphanumeric,
+            's' special; cased symbols such as circled letters count as
+            special and are 'U' or 'L'
+    """
+    if char.isdigit():
+        return 'd'
+    if char.isupper():
+        return 'u' if char.isalnum() else 'U'
+    if char.islower():
+        return 'l' if char.isalnum() else 'L'
+    return 'a' if char.isalnum() else 's'
+
+
+class _CharacterClasses(dict):
+    """
+    str.translate table mapping characters to their class letters.
+    
+    Latin-1 is precomputed; other characters are classified on lookup and not
+    stored, so the table stays bounded whatever input it sees.
+    """
+    
+    def __missing__(self, code: int) -> str:
+        return _character_class(chr(code))
+
+
+_CHARACTER_CLASSES = _CharacterClasses(
+    (code, _character_class(chr(code))) for code in range(256)
+)
+
+# Class letters of alphanumeric characters; every other class is special
+_ALPHANUMERIC_CLASSES = 'dula'
+
+
+@lru_cache(maxsize=256)
+def _sequence_repeat_regex(seq_len: int) -> re.Pattern:
+    """
+    Compile the pattern for a sequence of seq_len characters repeated 2+ times.
+    
+    Args:
+        seq_len (int): Length of the repeated sequence
+        
+    Returns:
+        re.Pattern: Compiled pattern; group 1 is the sequence
+    """
+    return re.compile(r'(.{%d})\1+' % seq_len, re.DOTALL)
+
+
+def _step_runs(steps: List, step: int) -> List[Tuple[int, int]]:
+    """
+    Find maximal runs of at least two consecutive equal steps.
+    
+    Uses list.count and list.index to jump between candidate steps, so only
+    actual runs are examined in Python.
+    
+    Args:
+        steps (list): Differences between neighbouring values
+        step (int): Step value to look for
+        
+    Returns:
+        list: (start index, number of steps) for each run
+    """
+    runs = []
+    remaining = steps.count(step)
+    i = 0
+    while remaining:
+        i = steps.index(step, i)
+        end = i + 1
+        while end < len(steps) and steps[end] == step:
+            end += 1
+        if end - i >= 2:
+            runs.append((i, end - i))
+        remaining -= end - i
+        i = end
+    return runs
+
+
+def _build_pattern_automaton(rows: List[str], walks: List[str],
+                             words: List[str]) -> _Automaton:
+    """
+    Build the automaton matching keyboard patterns and common words.
+    
+    Each word maps to a tuple of (rank, type, pattern) entries. The rank gives
+    the order in which an exhaustive row / walk / reversed-row / common-word
+    scan would report the pattern, so results keep that order.
+    
+    Args:
+        rows (list): Keyboard rows
+        walks (list): Common keyboard walks
+        words (list): Common password words
+        
+    Returns:
+        _Automaton: Automaton over every keyboard pattern and common word
+    """
+    candidates = []
+    for row in rows:
+        for length in range(3, len(row) + 1):
+            for start in range(len(row) - length + 1):
+                candidates.append(('keyboard_row', row[start:start + length]))
+    for walk in walks:
+        candidates.append(('keyboard_walk', walk))
+    for row in rows:
+        reversed_row = row[::-1]
+        for length in range(3, len(reversed_row) + 1):
+            for start in range(len(reversed_row) - length + 1):
+                candidates.append(('reversed_keyboard', reversed_row[start:start + length]))
+    for word in words:
+        candidates.append(('common_word', word))
+    
+    entries = {}
+    for rank, (pattern_type, pattern) in enumerate(candidates):
+        entries[pattern] = entries.get(pattern, ()) + ((rank, pattern_type, pattern),)
+    
+    automaton = _Automaton()
+    for pattern, value in entries.items():
+        automaton.add_word(pattern, value)
+    automaton.make_automaton()
+    return automaton
+
+
+def _invert_substitutions(substitutions: Dict[str, List[str]]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Map each substitute character to the letters it can stand in for.
+    
+    Args:
+        substitutions (dict): Letter -> list of substitute characters
+        
+    Returns:
+        dict: Substitute character -> tuple of letters, in table order
+    """
+    letters = {}
+    for letter, substitutes in substitutions.items():
+        for substitute in substitutes:
+            letters[substitute] = letters.get(substitute, ()) + (letter,)
+    return letters
+
+
+def _leet_translations(letters_by_substitute: Dict[str, Tuple[str, ...]]) -> Tuple[Dict[int, str], ...]:
+    """
+    Build translation tables undoing leetspeak.
+    
+    Table k maps each substitute to the k-th letter it stands for (or its
+    last, if it has fewer). Each table is applied to the whole password, so
+    an ambiguous substitute such as '1' ('i' or 'l') is read the same way
+    everywhere; a password mixing its readings is not matched.
+    
+    Args:
+        letters_by_substitute (dict): Substitute character -> tuple of letters
+        
+    Returns:
+        tuple: str.translate tables
+    """
+    readings = max(map(len, letters_by_substitute.values()), default=1)
+    return tuple(
+        str.maketrans({substitute: letters[min(k, len(letters) - 1)]
+                       for substitute, letters in letters_by_substitute.items()})
+        for k in range(readings)
+    )
+
+
+# Word list for detect_common_words, shipped in the repository's data folder
+_COMMON_PASSWORDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                      '..', 'data', 'common_passwords.txt')
+
+
+def _load_word_list(path: str) -> List[str]:
+    """
+    Load a word list file, one word per line.
+    
+    Blank lines and lines starting with '#' are skipped, words are
+    lowercased, and repeats are dropped.
+    
+    Args:
+        path (str): Path to the word list
+        
+    Returns:
+        list: Words in file order
+    """
+    with open(path, encoding='utf-8') as word_file:
+        words = (line.strip().lower() for line in word_file)
+        return list(dict.fromkeys(word for word in words
+                                  if word and not word.startswith('#')))
+
+
+# Optional LRU cache of detect_all_patterns results, shared by every detector.
+# Off unless PATTERN_CACHE_SIZE is set. Entries hold the results and the
+# pattern log, keyed by a salted digest of the password.
+_pattern_cache = DigestCache(int(os.environ.get('PATTERN_CACHE_SIZE', '0')))
+
 
 class PatternDetector:
     """
@@ -56,35 +384,89 @@ class PatternDetector:
         'z': ['2']
     }
     
-    # Common password patterns
-    COMMON_PATTERNS = [
-        'password', 'admin', 'welcome', 'login', 'user',
-        'letmein', 'monkey', 'dragon', 'master', 'sunshine'
-    ]
+    # Common password patterns, from data/common_passwords.txt
+    COMMON_PATTERNS = _load_word_list(_COMMON_PASSWORDS_PATH)
+    
+    # Substitute character -> letters it replaces
+    _LEET_LETTERS_BY_SUBSTITUTE = _invert_substitutions(LEET_SUBSTITUTIONS)
+    
+    # Translation tables undoing leetspeak, one per reading of ambiguous
+    # substitutes ('1' -> 'i' everywhere, then '1' -> 'l' everywhere)
+    _LEET_TRANSLATIONS = _leet_translations(_LEET_LETTERS_BY_SUBSTITUTE)
+    
+    # Every keyboard row, walk and reversed-row pattern and every common word,
+    # matched together in one pass
+    _PATTERN_AUTOMATON = _build_pattern_automaton(KEYBOARD_ROWS, KEYBOARD_WALKS,
+                                                  COMMON_PATTERNS)
     
     def __init__(self):
         """Initialize the pattern detector"""
-        self.detected_patterns = []
+        self._pattern_log = []
+    
+    @property
+    def detected_patterns(self) -> List[str]:
+        """Descriptions of the patterns found, formatted on access"""
+        return [_PATTERN_LABELS[entry[0]].format(*entry[1:])
+                for entry in self._pattern_log]
+    
+    @detected_patterns.setter
+    def detected_patterns(self, patterns: List[str]) -> None:
+        self._pattern_log = [(_DESCRIPTION, pattern) for pattern in patterns]
     
     def detect_all_patterns(self, password: str) -> Dict[str, any]:
         """
         Perform comprehensive pattern detection on a password.
         
+        When the pattern cache is enabled, the nested results of a repeated
+        password are shared with the cache and must not be modified.
+        
         Args:
             password (str): Password to analyze
             
         Returns:
             dict: Dictionary containing all detected patterns and scores
         """
-        self.detected_patterns = []
+        if not _pattern_cache.maxsize:
+            return self._run_detectors(password)
+        
+        entry = _pattern_cache.get(password)
+        if entry is None:
+            results = self._run_detectors(password)
+            _pattern_cache.put(password, (results, tuple(self._pattern_log)))
+        else:
+            results, pattern_log = entry
+            self._pattern_log = list(pattern_log)
+        
+        # Callers get their own top-level dict so they cannot replace cached
+        # results
+        return dict(results)
+    
+    def _run_detectors(self, password: str) -> Dict[str, any]:
+        """
+        Run every detector for detect_all_patterns.
+        
+        Args:
+            password (str): Password to analyze
+            
+        Returns:
+            dict: Dictionary containing all detected patterns and scores
+        """
+        self._pattern_log = []
+        
+        # Lowercase once and share it between the detectors that need it, and
+        # find keyboard patterns and common words in a single scan
+        password_lower = password.lower()
+        pattern_matches = self._scan_patterns(password_lower)
         
         results = {
-            'keyboard_patterns': self.detect_keyboard_patterns(password),
-            'sequential_patterns': self.detect_sequential_patterns(password),
+            'keyboard_patterns': self.detect_keyboard_patterns(password, password_lower,
+                                                               pattern_matches),
+            'sequential_patterns': self.detect_sequential_patterns(password, password_lower),
             'repetition_patterns': self.detect_repetition_patterns(password),
             'leet_speak': self.detect_leet_speak(password),
             'date_patterns': self.detect_date_patterns(password),
-            'common_words': self.detect_common_words(password),
+            'common_words': self.detect_common_words(password, password_lower,
+                                                     pattern_matches),
             'character_patterns': self.analyze_character_patterns(password),
             'overall_score': 0,
             'pattern_count': 0,
@@ -94,60 +476,123 @@ class PatternDetector:
         # Calculate overall pattern score (0-100, higher is worse)
         pattern_score = self._calculate_pattern_score(results)
         results['overall_score'] = pattern_score
-        results['pattern_count'] = len(self.detected_patterns)
+        results['pattern_count'] = len(self._pattern_log)
         results['warnings'] = self._generate_warnings(results)
         
         return results
     
-    def detect_keyboard_patterns(self, password: str) -> Dict[str, any]:
+    def detect_all_patterns_batch(self, passwords: Iterable[str],
+                                  workers: int = 1) -> List[Dict[str, any]]:
+        """
+        Perform pattern detection on many passwords, such as a wordlist.
+        
+        Pattern descriptions are not kept; detected_patterns is left empty.
+        
+        Args:
+            passwords (iterable): Passwords to analyze
+            workers (int): Number of worker processes; 1 runs in this process
+            
+        Returns:
+            list: detect_all_patterns() result for each password, in order
+        """
+        if workers <= 1:
+            results = [self.detect_all_patterns(password) for password in passwords]
+        else:
+            # Large chunks keep pickling and inter-process overhead small
+            # relative to the detection work
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_detect_all_patterns, passwords,
+                                            chunksize=_BATCH_CHUNK_SIZE))
+        
+        self._pattern_log = []
+        return results
+    
+    def _scan_patterns(self, password_lower: str) -> List[Tuple[str, str, int]]:
+        """
+        Find every keyboard pattern and common word in one scan.
+        
+        Common words spelled in leetspeak (p@ssw0rd, 1ogin) are found by
+        further scans of the password with substitutions undone, one for each
+        translation table that changes it.
+        
+        Args:
+            password_lower (str): Lowercased password to scan
+            
+        Returns:
+            list: (type, pattern, position) of each pattern's first occurrence,
+                in reporting order
+        """
+        matches = {}
+        for end, entries in self._PATTERN_AUTOMATON.iter(password_lower):
+            for rank, pattern_type, pattern in entries:
+                if rank not in matches:
+                    matches[rank] = (pattern_type, pattern, end - len(pattern) + 1)
+        
+        # Translation is one character for one, so positions carry over.
+        # Plain occurrences found above take precedence.
+        scanned = {password_lower}
+        for table in self._LEET_TRANSLATIONS:
+            normalized = password_lower.translate(table)
+            if normalized in scanned:
+                continue
+            scanned.add(normalized)
+            for end, entries in self._PATTERN_AUTOMATON.iter(normalized):
+                for rank, pattern_type, pattern in entries:
+                    if pattern_type == 'common_word' and rank not in matches:
+                        matches[rank] = (pattern_type, pattern, end - len(pattern) + 1)
+        
+        return [matches[rank] for rank in sorted(matches)]
+    
+    def detect_keyboard_patterns(self, password: str,
+                                 password_lower: Optional[str] = None,
+                                 pattern_matches: Optional[List] = None) -> Dict[str, any]:
         """
         Detect keyboard walk patterns in password.
         
         Args:
             password (str): Password to check
+            password_lower (str): password.lower(), if already computed
+            pattern_matches (list): _scan_patterns() result, if already computed
             
         Returns:
             dict: Information about keyboard patterns found
         """
-        password_lower = password.lower()
+        if pattern_matches is None:
+            if password_lower is None:
+                password_lower = password.lower()
+            pattern_matches = self._scan_patterns(password_lower)
         found_patterns = []
+        log = []
         
-        # Check for keyboard rows
-        for row in self.KEYBOARD_ROWS:
-            for length in range(3, len(row) + 1):
-                for start in range(len(row) - length + 1):
-                    pattern = row[start:start + length]
-                    if pattern in password_lower and len(pattern) >= 3:
-                        found_patterns.append({
-                            'type': 'keyboard_row',
-                            'pattern': pattern,
-                            'length': len(pattern),
-                            'position': password_lower.index(pattern)
-                        })
-                        self.detected_patterns.append(f"Keyboard row: {pattern}")
-        
-        # Check for common keyboard walks
-        for walk in self.KEYBOARD_WALKS:
-            if walk in password_lower:
+        for pattern_type, pattern, position in pattern_matches:
+            if pattern_type == 'common_word':
+                continue
+            
+            if pattern_type == 'keyboard_row':
+                found_patterns.append({
+                    'type': 'keyboard_row',
+                    'pattern': pattern,
+                    'length': len(pattern),
+                    'position': position
+                })
+                log.append((_KEYBOARD_ROW, pattern))
+            
+            elif pattern_type == 'keyboard_walk':
                 found_patterns.append({
                     'type': 'keyboard_walk',
-                    'pattern': walk,
-                    'length': len(walk)
+                    'pattern': pattern,
+                    'length': len(pattern)
+                })
+                log.append((_KEYBOARD_WALK, pattern))
+            
+            else:
+                found_patterns.append({
+                    'type': 'reversed_keyboard',
+                    'pattern': pattern,
+                    'length': len(pattern)
                 })
-                self.detected_patterns.append(f"Keyboard walk: {walk}")
-        
-        # Check for reversed patterns
-        for row in self.KEYBOARD_ROWS:
-            reversed_row = row[::-1]
-            for length in range(3, len(reversed_row) + 1):
-                for start in range(len(reversed_row) - length + 1):
-                    pattern = reversed_row[start:start + length]
-                    if pattern in password_lower and len(pattern) >= 3:
-                        found_patterns.append({
-                            'type': 'reversed_keyboard',
-                            'pattern': pattern,
-                            'length': len(pattern)
-                        })
+        
+        self._pattern_log.extend(log)
         
         return {
             'found': len(found_patterns) > 0,
@@ -155,94 +600,75 @@ class PatternDetector:
             'count': len(found_patterns)
         }
     
-    def detect_sequential_patterns(self, password: str) -> Dict[str, any]:
+    def detect_sequential_patterns(self, password: str,
+                                   password_lower: Optional[str] = None) -> Dict[str, any]:
         """
         Detect sequential characters (abc, 123, etc.).
         
         Args:
             password (str): Password to check
+            password_lower (str): password.lower(), if already computed
             
         Returns:
             dict: Information about sequential patterns
         """
         found_sequences = []
-        password_lower = password.lower()
+        log = []
         
-        # Check for alphabetic sequences (length 3+)
-        for i in range(len(password_lower) - 2):
-            # Forward sequence
-            if (ord(password_lower[i+1]) == ord(password_lower[i]) + 1 and
-                ord(password_lower[i+2]) == ord(password_lower[i]) + 2):
-                
-                # Extend the sequence
-                seq_len = 3
-                while (i + seq_len < len(password_lower) and
-                       ord(password_lower[i + seq_len]) == ord(password_lower[i]) + seq_len):
-                    seq_len += 1
-                
-                sequence = password_lower[i:i+seq_len]
-                found_sequences.append({
-                    'type': 'alphabetic_forward',
-                    'sequence': sequence,
-                    'length': seq_len,
-                    'position': i
-                })
-                self.detected_patterns.append(f"Alphabetic sequence: {sequence}")
-            
-            # Backward sequence
-            if (ord(password_lower[i+1]) == ord(password_lower[i]) - 1 and
-                ord(password_lower[i+2]) == ord(password_lower[i]) - 2):
-                
-                seq_len = 3
-                while (i + seq_len < len(password_lower) and
-                       ord(password_lower[i + seq_len]) == ord(password_lower[i]) - seq_len):
-                    seq_len += 1
-                
-                sequence = password_lower[i:i+seq_len]
-                found_sequences.append({
-                    'type': 'alphabetic_backward',
-                    'sequence': sequence,
-                    'length': seq_len,
-                    'position': i
-                })
-                self.detected_patterns.append(f"Reverse alphabetic: {sequence}")
-        
-        # Check for numeric sequences
-        for i in range(len(password) - 2):
-            if password[i:i+3].isdigit():
-                num1, num2, num3 = int(password[i]), int(password[i+1]), int(password[i+2])
-                
-                # Forward sequence
-                if num2 == num1 + 1 and num3 == num2 + 1:
-                    seq_len = 3
-                    while (i + seq_len < len(password) and password[i+seq_len].isdigit() and
-                           int(password[i+seq_len]) == int(password[i]) + seq_len):
-                        seq_len += 1
-                    
-                    sequence = password[i:i+seq_len]
-                    found_sequences.append({
-                        'type': 'numeric_forward',
-                        'sequence': sequence,
-                        'length': seq_len,
-                        'position': i
-                    })
-                    self.detected_patterns.append(f"Numeric sequence: {sequence}")
-                
-                # Backward sequence
-                if num2 == num1 - 1 and num3 == num2 - 1:
-                    seq_len = 3
-                    while (i + seq_len < len(password) and password[i+seq_len].isdigit() and
-                           int(password[i+seq_len]) == int(password[i]) - seq_len):
-                        seq_len += 1
-                    
-                    sequence = password[i:i+seq_len]
-                    found_sequences.append({
-                        'type': 'numeric_backward',
-                        'sequence': sequence,
-                        'length': seq_len,
-                        'position': i
-                    })
-                    self.detected_patterns.append(f"Reverse numeric: {sequence}")
+        # A sequence needs at least three characters; skip building the step
+        # lists for anything shorter
+        if len(password) < 3:
+            return {
+                'found': False,
+                'sequences': found_sequences,
+                'count': 0
+            }
+        
+        if password_lower is None:
+            password_lower = password.lower()
+        
+        # Differences between neighbouring characters, computed in C
+        codes = list(map(ord, password_lower))
+        alphabetic_steps = list(map(operator.sub, codes[1:], codes))
+        
+        # Differences between neighbouring digit values. For ASCII input every
+        # non-digit becomes NUL, so only digit pairs can differ by 1; other
+        # input falls back to per-character decimal values.
+        if password.isascii():
+            digit_codes = list(password.translate(_ASCII_DIGITS_ONLY).encode())
+            numeric_steps = list(map(operator.sub, digit_codes[1:], digit_codes))
+        else:
+            digits = [int(c) if c.isdecimal() else None for c in password]
+            numeric_steps = [b - a if a is not None and b is not None else None
+                             for a, b in zip(digits, digits[1:])]
+        
+        scans = [
+            (0, password_lower, alphabetic_steps, 1, 'alphabetic_forward', _ALPHABETIC_SEQUENCE),
+            (0, password_lower, alphabetic_steps, -1, 'alphabetic_backward', _REVERSE_ALPHABETIC),
+            (1, password, numeric_steps, 1, 'numeric_forward', _NUMERIC_SEQUENCE),
+            (1, password, numeric_steps, -1, 'numeric_backward', _REVERSE_NUMERIC),
+        ]
+        
+        # Every start inside a run begins a sequence that extends to the run's
+        # end: alphabetic before numeric, then by position, forward first
+        hits = []
+        for group, text, steps, step, sequence_type, category in scans:
+            for run_start, run_steps in _step_runs(steps, step):
+                run_end = run_start + run_steps
+                for i in range(run_start, run_end - 1):
+                    hits.append((group, i, step < 0, text[i:run_end + 1], sequence_type, category))
+        hits.sort()
+        
+        for _, i, _, sequence, sequence_type, category in hits:
+            found_sequences.append({
+                'type': sequence_type,
+                'sequence': sequence,
+                'length': len(sequence),
+                'position': i
+            })
+            log.append((category, sequence))
+        
+        self._pattern_log.extend(log)
         
         return {
             'found': len(found_sequences) > 0,
@@ -261,50 +687,41 @@ class PatternDetector:
             dict: Information about repetition patterns
         """
         repetitions = []
+        log = []
         
-        # Check for repeated single characters (aaa, 111, etc.)
-        i = 0
-        while i < len(password):
-            char = password[i]
-            count = 1
-            
-            while i + count < len(password) and password[i + count] == char:
-                count += 1
-            
-            if count >= 3:
-                repetitions.append({
-                    'type': 'character_repetition',
-                    'character': char,
-                    'count': count,
-                    'position': i
-                })
-                self.detected_patterns.append(f"Repeated character: '{char}' x{count}")
-            
-            i += count
+        # Check for repeated single characters (aaa, 111, etc.). The regex
+        # engine skips over runs too short to report without returning to
+        # Python.
+        for match in _CHARACTER_RUN_RE.finditer(password):
+            char = match.group(1)
+            count = match.end() - match.start()
+            repetitions.append({
+                'type': 'character_repetition',
+                'character': char,
+                'count': count,
+                'position': match.start()
+            })
+            log.append((_REPEATED_CHARACTER, char, count))
         
-        # Check for repeated sequences (abcabc, 123123, etc.)
+        # Check for repeated sequences (abcabc, 123123, etc.). The leftmost
+        # match of each length's pattern is its first repeat, and the greedy
+        # backreference consumes every following copy.
         for seq_len in range(2, len(password) // 2 + 1):
-            for i in range(len(password) - seq_len * 2 + 1):
-                sequence = password[i:i+seq_len]
-                if password[i+seq_len:i+seq_len*2] == sequence:
-                    # Count how many times it repeats
-                    repeat_count = 2
-                    pos = i + seq_len * 2
-                    while pos + seq_len <= len(password) and password[pos:pos+seq_len] == sequence:
-                        repeat_count += 1
-                        pos += seq_len
-                    
-                    if repeat_count >= 2:
-                        repetitions.append({
-                            'type': 'sequence_repetition',
-                            'sequence': sequence,
-                            'repeat_count': repeat_count,
-                            'position': i
-                        })
-                        self.detected_patterns.append(
-                            f"Repeated sequence: '{sequence}' x{repeat_count}"
-                        )
-                        break
+            match = _sequence_repeat_regex(seq_len).search(password)
+            if match is None:
+                continue
+            
+            sequence = match.group(1)
+            repeat_count = (match.end() - match.start()) // seq_len
+            repetitions.append({
+                'type': 'sequence_repetition',
+                'sequence': sequence,
+                'repeat_count': repeat_count,
+                'position': match.start()
+            })
+            log.append((_REPEATED_SEQUENCE, sequence, repeat_count))
+        
+        self._pattern_log.extend(log)
         
         return {
             'found': len(repetitions) > 0,
@@ -324,32 +741,23 @@ class PatternDetector:
         """
         leet_chars_found = []
         
-        for char_lower in password.lower():
-            for letter, substitutes in self.LEET_SUBSTITUTIONS.items():
-                if char_lower in substitutes and password[password.lower().index(char_lower)].isdigit() or \
-                   password[password.lower().index(char_lower)] in ['@', '$', '!']:
-                    leet_chars_found.append({
-                        'original': letter,
-                        'substitute': password[password.lower().index(char_lower)]
-                    })
-        
-        # Check for common leet patterns
-        leet_score = 0
-        if re.search(r'[4@]', password):  # a -> 4/@
-            leet_score += 1
-        if re.search(r'3', password):  # e -> 3
-            leet_score += 1
-        if re.search(r'[1!]', password):  # i -> 1/!
-            leet_score += 1
-        if re.search(r'0', password):  # o -> 0
-            leet_score += 1
-        if re.search(r'[5$]', password):  # s -> 5/$
-            leet_score += 1
+        # One pass over the password; each substitute is recorded once per
+        # letter it can stand for (e.g. '1' for both 'i' and 'l')
+        letters_by_substitute = self._LEET_LETTERS_BY_SUBSTITUTE
+        for char in password:
+            for letter in letters_by_substitute.get(char, ()):
+                leet_chars_found.append({
+                    'original': letter,
+                    'substitute': char
+                })
+        
+        # Check for common leet patterns: one point per letter substituted
+        leet_score = len({_LEET_LETTERS[c] for c in _LEET_RE.findall(password)})
         
         uses_leet = leet_score >= 2
         
         if uses_leet:
-            self.detected_patterns.append("Uses leetspeak substitutions")
+            self._pattern_log.append((_LEET_SPEAK,))
         
         return {
             'found': uses_leet,
@@ -369,11 +777,20 @@ class PatternDetector:
             dict: Information about date patterns
         """
         dates_found = []
-        current_year = datetime.now().year
+        log = []
         
-        # Check for 4-digit years (1900-2099)
-        year_pattern = re.finditer(r'(19\d{2}|20\d{2})', password)
-        for match in year_pattern:
+        # Check for 4-digit years (1900-2099). Every full date format below
+        # also ends in one, so without a year there is nothing else to find.
+        year_matches = list(_YEAR_RE.finditer(password))
+        if not year_matches:
+            return {
+                'found': False,
+                'dates': dates_found,
+                'count': 0
+            }
+        
+        current_year = datetime.now().year
+        for match in year_matches:
             year = int(match.group())
             if 1900 <= year <= current_year + 10:
                 dates_found.append({
@@ -381,23 +798,19 @@ class PatternDetector:
                     'value': year,
                     'position': match.start()
                 })
-                self.detected_patterns.append(f"Year detected: {year}")
+                log.append((_YEAR, year))
         
         # Check for date formats (MMDDYYYY, DDMMYYYY)
-        date_patterns = [
-            r'(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])(19|20)\d{2}',  # MMDDYYYY
-            r'(0[1-9]|[12]\d|3[01])(0[1-9]|1[0-2])(19|20)\d{2}',  # DDMMYYYY
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, password)
-            for match in matches:
+        for pattern in _FULL_DATE_RES:
+            for match in pattern.finditer(password):
                 dates_found.append({
                     'type': 'full_date',
                     'value': match.group(),
                     'position': match.start()
                 })
-                self.detected_patterns.append(f"Date pattern: {match.group()}")
+                log.append((_FULL_DATE, match.group()))
+        
+        self._pattern_log.extend(log)
         
         return {
             'found': len(dates_found) > 0,
@@ -405,26 +818,38 @@ class PatternDetector:
             'count': len(dates_found)
         }
     
-    def detect_common_words(self, password: str) -> Dict[str, any]:
+    def detect_common_words(self, password: str,
+                            password_lower: Optional[str] = None,
+                            pattern_matches: Optional[List] = None) -> Dict[str, any]:
         """
-        Detect common password base words.
+        Detect common password base words, including leetspeak spellings.
         
         Args:
             password (str): Password to check
+            password_lower (str): password.lower(), if already computed
+            pattern_matches (list): _scan_patterns() result, if already computed
             
         Returns:
             dict: Information about common words found
         """
-        password_lower = password.lower()
+        if pattern_matches is None:
+            if password_lower is None:
+                password_lower = password.lower()
+            pattern_matches = self._scan_patterns(password_lower)
         found_words = []
+        log = []
         
-        for word in self.COMMON_PATTERNS:
-            if word in password_lower:
-                found_words.append({
-                    'word': word,
-                    'position': password_lower.index(word)
-                })
-                self.detected_patterns.append(f"Common word: {word}")
+        for pattern_type, word, position in pattern_matches:
+            if pattern_type != 'common_word':
+                continue
+            
+            found_words.append({
+                'word': word,
+                'position': position
+            })
+            log.append((_COMMON_WORD, word))
+        
+        self._pattern_log.extend(log)
         
         return {
             'found': len(found_words) > 0,
@@ -445,32 +870,36 @@ class PatternDetector:
         if not password:
             return {}
         
+        # Classify every character in one translate() call; every check below
+        # works on the resulting class string
+        classes = password.translate(_CHARACTER_CLASSES)
+        
         # Character position patterns
-        starts_with_upper = password[0].isupper()
-        ends_with_digit = password[-1].isdigit()
-        ends_with_special = not password[-1].isalnum()
+        starts_with_upper = classes[0] in 'uU'
+        ends_with_digit = classes[-1] == 'd'
+        ends_with_special = classes[-1] not in _ALPHANUMERIC_CLASSES
         
         # Common pattern: Uppercase first, lowercase middle, digits/special at end
+        middle = classes[1:-2]
         follows_common_structure = (
             starts_with_upper and
-            any(c.islower() for c in password[1:-2]) and
+            ('l' in middle or 'L' in middle) and
             (ends_with_digit or ends_with_special)
         )
         
         if follows_common_structure:
-            self.detected_patterns.append(
-                "Follows common structure: Upper+lower+digits/special"
-            )
-        
-        # Check character clustering
-        digit_positions = [i for i, c in enumerate(password) if c.isdigit()]
-        special_positions = [i for i, c in enumerate(password) if not c.isalnum()]
+            self._pattern_log.append((_COMMON_STRUCTURE,))
         
-        digits_clustered = len(digit_positions) > 1 and \
-                          max(digit_positions) - min(digit_positions) < len(password) / 2
+        # Check character clustering from the first and last of each class
+        first_digit = classes.find('d')
+        last_digit = classes.rfind('d')
+        digits_clustered = first_digit != last_digit and \
+                          last_digit - first_digit < len(password) / 2
         
-        specials_clustered = len(special_positions) > 1 and \
-                            max(special_positions) - min(special_positions) < len(password) / 2
+        first_special = len(classes) - len(classes.lstrip(_ALPHANUMERIC_CLASSES))
+        last_special = len(classes.rstrip(_ALPHANUMERIC_CLASSES)) - 1
+        specials_clustered = first_special < last_special and \
+                            last_special - first_special < len(password) / 2
         
         return {
             'starts_with_uppercase': starts_with_upper,
@@ -549,12 +978,30 @@ class PatternDetector:
         if results['common_words']['found']:
             warnings.append("⚠️ Based on common password words")
         
-        if results['character_patterns']['follows_common_structure']:
+        # character_patterns is empty for an empty password
+        if results['character_patterns'].get('follows_common_structure'):
             warnings.append("⚠️ Follows predictable password structure")
         
         return warnings
 
 
+# Passwords sent to a worker process at a time by detect_all_patterns_batch
+_BATCH_CHUNK_SIZE = 512
+
+
+def _detect_all_patterns(password: str) -> Dict[str, any]:
+    """
+    Run detect_all_patterns on one password in a batch worker process.
+    
+    Args:
+        password (str): Password to analyze
+        
+    Returns:
+        dict: Detection results
+    """
+    return PatternDetector().detect_all_patterns(password)
+
+
 # Example usage and testing
 if __name__ == "__main__":
     print("=" * 70)
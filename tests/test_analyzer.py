@@ -1,4 +1,7 @@
 """Basic tests for password analyzer"""
+from types import SimpleNamespace
+import requests
+import src.analyzer
 from src.analyzer import analyze_password, get_strength_label, check_pwned_password
 
 def test_weak_password():
@@ -15,6 +18,97 @@ def test_strong_password():
     assert result['has_digits'] == True
     assert result['has_special'] == True
 
+def test_lone_surrogate_is_not_special():
+    result = analyze_password("\ud800abc")
+    assert result['has_special'] == False
+    assert result['has_lowercase'] == True
+
+def test_cached_analysis():
+    src.analyzer._analysis_cache.maxsize = 2
+    try:
+        first = analyze_password("MyS3cur3P@ssw0rd!2024")
+        first['score'] = -1
+        second = analyze_password("MyS3cur3P@ssw0rd!2024")
+        assert second['score'] == 6
+        analyze_password("pass")
+        analyze_password("another password")
+        assert len(src.analyzer._analysis_cache) == 2
+    finally:
+        src.analyzer._analysis_cache.maxsize = 0
+        src.analyzer._analysis_cache.clear()
+
+def test_zxcvbn_result_object():
+    # The Rust port returns an object with attributes rather than a dict
+    def stub_zxcvbn(password):
+        crack_times = SimpleNamespace(offline_slow_hashing_1e4_per_second="2 years")
+        return SimpleNamespace(score=3, crack_times_display=crack_times)
+    
+    original = src.analyzer._get_zxcvbn()
+    src.analyzer._zxcvbn = stub_zxcvbn
+    try:
+        result = analyze_password("MyS3cur3P@ssw0rd!2024")
+        assert result['entropy_score'] == 3
+        assert result['crack_time'] == "2 years"
+    finally:
+        src.analyzer._zxcvbn = original
+
+# SHA-1 of "password123" is CBFDA + this suffix
+_SUFFIX = b"C6008F9CAB4083784CBD1874F76618D2A97"
+
+class _StubResponse:
+    def __init__(self, lines, status_code=200):
+        self.lines = lines
+        self.status_code = status_code
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+    
+    def iter_lines(self):
+        return iter(self.lines)
+
+class _StubSession:
+    def __init__(self, response):
+        self.response = response
+    
+    def get(self, url, **kwargs):
+        return self.response
+
+def _check_with_response(response, password="password123"):
+    saved_session = src.analyzer._session
+    src.analyzer._session = _StubSession(response)
+    src.analyzer._range_cache.clear()
+    src.analyzer._pwned_hashes.clear()
+    try:
+        return check_pwned_password(password)
+    finally:
+        src.analyzer._session = saved_session
+        src.analyzer._pwned_hashes.clear()
+
+def test_breach_range_parsing():
+    lines = [b"Error: blocked", b"<html>", b"0" * 35 + b":3", _SUFFIX + b":42\r"]
+    assert _check_with_response(_StubResponse(lines)) == (True, 42)
+    lines = [b"Error: blocked", b"0" * 35 + b":3", _SUFFIX + b":many"]
+    assert _check_with_response(_StubResponse(lines)) == (False, 0)
+    src.analyzer._range_cache.clear()
+
+def test_breach_range_errors():
+    failure = (None, "Could not check breach database")
+    valid = [_SUFFIX + b":42"]
+    for response in (_StubResponse(valid, status_code=204),
+                     _StubResponse(valid, status_code=302),
+                     _StubResponse(valid, status_code=503),
+                     _StubResponse([b"Error: blocked", b"<html>"]),
+                     _StubResponse([])):
+        assert _check_with_response(response) == failure
+        assert len(src.analyzer._range_cache) == 0
+
 def test_known_breach():
     is_pwned, count = check_pwned_password("password123")
     assert is_pwned == True
@@ -27,6 +121,11 @@ def test_unique_password():
 if __name__ == "__main__":
     test_weak_password()
     test_strong_password()
+    test_lone_surrogate_is_not_special()
+    test_cached_analysis()
+    test_zxcvbn_result_object()
+    test_breach_range_parsing()
+    test_breach_range_errors()
     test_known_breach()
     test_unique_password()
     print("✓ All tests passed!")
\ No newline at end of file
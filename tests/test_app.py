@@ -0,0 +1,21 @@
+"""Basic tests for the Flask routes"""
+from app import app
+
+def test_analyze_lone_surrogate():
+    client = app.test_client()
+    response = client.post('/analyze', data='{"password": "\\ud800x"}',
+                           content_type='application/json')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['length'] == 2
+    assert data['has_special'] is False
+    assert data['is_breached'] is None
+
+def test_analyze_empty_password():
+    response = app.test_client().post('/analyze', json={'password': ''})
+    assert response.status_code == 400
+
+if __name__ == "__main__":
+    test_analyze_lone_surrogate()
+    test_analyze_empty_password()
+    print("✓ All tests passed!")
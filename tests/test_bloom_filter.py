@@ -0,0 +1,43 @@
+"""Basic tests for the breach Bloom filter"""
+import hashlib
+from src.bloom_filter import BloomFilter
+
+def _digest(password):
+    return hashlib.sha1(password.encode('utf-8')).digest()
+
+def test_no_false_negatives():
+    bloom = BloomFilter(1000)
+    passwords = [f"password{i}" for i in range(1000)]
+    for password in passwords:
+        bloom.add(_digest(password))
+    assert all(_digest(password) in bloom for password in passwords)
+
+def test_false_positive_rate():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(_digest(f"password{i}"))
+    false_positives = sum(_digest(f"other{i}") in bloom for i in range(10000))
+    assert false_positives < 300
+
+def test_from_digest_file(tmp_path):
+    path = tmp_path / "digests.bin"
+    path.write_bytes(_digest("password123") + _digest("letmein"))
+    bloom = BloomFilter.from_digest_file(str(path))
+    assert _digest("password123") in bloom
+    assert _digest("letmein") in bloom
+
+def test_save_and_load(tmp_path):
+    bloom = BloomFilter(1000)
+    bloom.add(_digest("password123"))
+    path = tmp_path / "breach.bloom"
+    bloom.save(str(path))
+    loaded = BloomFilter.load(str(path))
+    assert (loaded.size, loaded.hash_count) == (bloom.size, bloom.hash_count)
+    assert _digest("password123") in loaded
+    assert sum(_digest(f"other{i}") in loaded for i in range(1000)) < 50
+
+def test_large_filter_positions():
+    bloom = BloomFilter(10)
+    bloom.size = 2 ** 40
+    positions = [next(bloom._positions(_digest(f"password{i}"))) for i in range(100)]
+    assert max(positions) >= 2 ** 32
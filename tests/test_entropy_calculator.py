@@ -0,0 +1,26 @@
+"""Basic tests for the entropy calculator"""
+from src.entropy_calculator import EntropyCalculator
+
+def test_short_password_cracks_instantly():
+    crack_time = EntropyCalculator().estimate_crack_time(10)
+    assert crack_time['average_case'] == "Instant"
+
+def test_huge_entropy():
+    result = EntropyCalculator().analyze_complete("aZ9!" * 200)
+    crack_time = result['crack_time_estimates']
+    assert crack_time['worst_case'] == "1.01e+1553 billion years"
+    assert crack_time['combinations'] == "3.18e+1578"
+
+def test_scientific_notation_by_magnitude():
+    calculator = EntropyCalculator()
+    assert calculator.estimate_crack_time(104)['worst_case'] == "643151.0 billion years"
+    assert calculator.estimate_crack_time(105)['worst_case'] == "1.29e+06 billion years"
+    # Same format on both sides of the float limit
+    assert calculator.estimate_crack_time(1023.9)['worst_case'] == "5.32e+282 billion years"
+    assert calculator.estimate_crack_time(1024)['worst_case'] == "5.70e+282 billion years"
+
+if __name__ == "__main__":
+    test_short_password_cracks_instantly()
+    test_huge_entropy()
+    test_scientific_notation_by_magnitude()
+    print("✓ All tests passed!")
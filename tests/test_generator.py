@@ -0,0 +1,28 @@
+"""Basic tests for password generator"""
+import string
+from collections import Counter
+from src.generator import generate_password, generate_multiple_passwords
+
+def test_password_length():
+    for length in (1, 8, 16, 128):
+        assert len(generate_password(length)) == length
+
+def test_character_options():
+    password = generate_password(200, use_uppercase=False, use_special=False)
+    assert set(password) <= set(string.ascii_lowercase + string.digits)
+
+def test_all_characters_reachable():
+    counts = Counter(generate_password(20000))
+    assert set(counts) == set(string.ascii_letters + string.digits + string.punctuation)
+
+def test_multiple_passwords():
+    passwords = generate_multiple_passwords(count=5, length=12)
+    assert len(passwords) == 5
+    assert len(set(passwords)) == 5
+
+if __name__ == "__main__":
+    test_password_length()
+    test_character_options()
+    test_all_characters_reachable()
+    test_multiple_passwords()
+    print("✓ All tests passed!")
@@ -0,0 +1,193 @@
+"""Basic tests for the pattern detector"""
+import src.pattern_detector
+from src.pattern_detector import PatternDetector, _Automaton, _sequence_repeat_regex, _step_runs
+
+def _common_words(password):
+    return PatternDetector().detect_common_words(password)['words']
+
+def _keyboard_patterns(password):
+    return PatternDetector().detect_keyboard_patterns(password)['patterns']
+
+def test_automaton_overlapping_words():
+    automaton = _Automaton()
+    for word in ("he", "she", "his", "hers"):
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    assert sorted(automaton.iter("ushers")) == [(3, "he"), (3, "she"), (5, "hers")]
+
+def test_keyboard_row_positions():
+    assert _keyboard_patterns("xxasdfxx") == [
+        {'type': 'keyboard_row', 'pattern': 'asd', 'length': 3, 'position': 2},
+        {'type': 'keyboard_row', 'pattern': 'sdf', 'length': 3, 'position': 3},
+        {'type': 'keyboard_row', 'pattern': 'asdf', 'length': 4, 'position': 2},
+    ]
+
+def test_reversed_keyboard_rows():
+    patterns = _keyboard_patterns("ytrewq")
+    assert {p['type'] for p in patterns} == {'reversed_keyboard'}
+    assert [p['pattern'] for p in patterns] == [
+        'ytr', 'tre', 'rew', 'ewq', 'ytre', 'trew', 'rewq', 'ytrew', 'trewq', 'ytrewq'
+    ]
+
+def test_row_that_is_also_a_walk():
+    patterns = _keyboard_patterns("QWERTY")
+    assert len(patterns) == 11
+    assert patterns[-2:] == [
+        {'type': 'keyboard_row', 'pattern': 'qwerty', 'length': 6, 'position': 0},
+        {'type': 'keyboard_walk', 'pattern': 'qwerty', 'length': 6},
+    ]
+
+def test_keyboard_walks():
+    assert [p['pattern'] for p in _keyboard_patterns("1qaz2wsx")] == ['qaz', 'wsx', '1qaz', '2wsx']
+
+def test_keyboard_reporting_order():
+    # Rows, then walks, then reversed rows, whatever their order in the password
+    assert _keyboard_patterns("poiqwe") == [
+        {'type': 'keyboard_row', 'pattern': 'qwe', 'length': 3, 'position': 3},
+        {'type': 'keyboard_walk', 'pattern': 'p', 'length': 1},
+        {'type': 'reversed_keyboard', 'pattern': 'poi', 'length': 3},
+    ]
+
+def test_keyboard_first_occurrence_only():
+    patterns = _keyboard_patterns("asdf-asdf")
+    assert [(p['pattern'], p['position']) for p in patterns] == [('asd', 0), ('sdf', 1), ('asdf', 0)]
+
+def test_step_runs():
+    assert _step_runs([1, 1, 0, 1, 1, 1, 1, 2, 1], 1) == [(0, 2), (3, 4)]
+    assert _step_runs([None, 1, -1, -1], -1) == [(2, 2)]
+    assert _step_runs([1, 0, 1], 1) == []
+
+def test_sequential_patterns():
+    sequences = PatternDetector().detect_sequential_patterns("abcd")['sequences']
+    assert sequences == [
+        {'type': 'alphabetic_forward', 'sequence': 'abcd', 'length': 4, 'position': 0},
+        {'type': 'alphabetic_forward', 'sequence': 'bcd', 'length': 3, 'position': 1},
+    ]
+
+def test_sequential_pattern_order():
+    # Alphabetic before numeric, then by position
+    sequences = PatternDetector().detect_sequential_patterns("x9876x")['sequences']
+    assert [(s['type'], s['sequence'], s['position']) for s in sequences] == [
+        ('alphabetic_backward', '9876', 1),
+        ('alphabetic_backward', '876', 2),
+        ('numeric_backward', '9876', 1),
+        ('numeric_backward', '876', 2),
+    ]
+    sequences = PatternDetector().detect_sequential_patterns("ab12cba")['sequences']
+    assert [(s['type'], s['sequence'], s['position']) for s in sequences] == [
+        ('alphabetic_backward', 'cba', 4),
+    ]
+
+def test_non_ascii_digit_sequence():
+    sequences = PatternDetector().detect_sequential_patterns("\u0663\u0664\u0665")['sequences']
+    assert [s['type'] for s in sequences] == ['alphabetic_forward', 'numeric_forward']
+
+def _repetitions(password):
+    return PatternDetector().detect_repetition_patterns(password)['repetitions']
+
+def test_sequence_repetition():
+    assert _repetitions("abcabcabc") == [
+        {'type': 'sequence_repetition', 'sequence': 'abc', 'repeat_count': 3, 'position': 0}
+    ]
+    assert _repetitions("q12121") == [
+        {'type': 'sequence_repetition', 'sequence': '12', 'repeat_count': 2, 'position': 1}
+    ]
+    assert _repetitions("abcabd-abab") == [
+        {'type': 'sequence_repetition', 'sequence': 'ab', 'repeat_count': 2, 'position': 7}
+    ]
+
+def test_sequence_repeat_regex():
+    match = _sequence_repeat_regex(2).search("q12121")
+    assert match.group(1) == "12"
+    assert match.span() == (1, 5)
+    assert _sequence_repeat_regex(3).search("abcabd") is None
+
+def test_character_and_sequence_repetition():
+    assert _repetitions("aaaaaa") == [
+        {'type': 'character_repetition', 'character': 'a', 'count': 6, 'position': 0},
+        {'type': 'sequence_repetition', 'sequence': 'aa', 'repeat_count': 3, 'position': 0},
+        {'type': 'sequence_repetition', 'sequence': 'aaa', 'repeat_count': 2, 'position': 0},
+    ]
+    assert _repetitions("ab") == []
+
+def test_plain_common_word():
+    assert _common_words("xxpasswordxx") == [{'word': 'password', 'position': 2}]
+
+def test_leetspeak_common_word():
+    assert _common_words("p@ssw0rd") == [{'word': 'password', 'position': 0}]
+    assert _common_words("My$un5h1ne") == [{'word': 'sunshine', 'position': 2}]
+
+def test_plain_match_takes_precedence():
+    assert _common_words("p@ssw0rd-password") == [{'word': 'password', 'position': 9}]
+
+def test_ambiguous_substitutes():
+    assert _common_words("we1come") == [{'word': 'welcome', 'position': 0}]
+    assert _common_words("1ogin") == [{'word': 'login', 'position': 0}]
+    assert _common_words("1etmein") == [{'word': 'letmein', 'position': 0}]
+
+def test_leetspeak_common_word_in_results():
+    detector = PatternDetector()
+    results = detector.detect_all_patterns("P@ssw0rd!")
+    assert results['common_words']['count'] == 1
+    assert "Common word: password" in detector.detected_patterns
+
+def test_empty_password():
+    results = PatternDetector().detect_all_patterns("")
+    assert results['pattern_count'] == 0
+    assert results['warnings'] == []
+
+def test_batch_matches_single():
+    passwords = ["p@ssw0rd", "", "qwerty123", "Summer2024!", "aaaa", "x"]
+    detector = PatternDetector()
+    expected = [PatternDetector().detect_all_patterns(password) for password in passwords]
+    assert detector.detect_all_patterns_batch(passwords) == expected
+    assert detector.detect_all_patterns_batch(passwords, workers=2) == expected
+    assert detector.detected_patterns == []
+
+def test_cached_detection():
+    src.pattern_detector._pattern_cache.maxsize = 2
+    try:
+        detector = PatternDetector()
+        first = detector.detect_all_patterns("qwerty123")
+        patterns = detector.detected_patterns
+        first['overall_score'] = -1
+        
+        other = PatternDetector()
+        second = other.detect_all_patterns("qwerty123")
+        assert second['overall_score'] != -1
+        assert second['pattern_count'] == first['pattern_count']
+        assert other.detected_patterns == patterns
+        
+        detector.detect_all_patterns("p@ssw0rd")
+        detector.detect_all_patterns("Summer2024!")
+        assert len(src.pattern_detector._pattern_cache) == 2
+        assert src.pattern_detector._pattern_cache.get("qwerty123") is None
+        assert detector.detect_all_patterns("qwerty123")['pattern_count'] == first['pattern_count']
+    finally:
+        src.pattern_detector._pattern_cache.maxsize = 0
+        src.pattern_detector._pattern_cache.clear()
+
+if __name__ == "__main__":
+    test_automaton_overlapping_words()
+    test_keyboard_row_positions()
+    test_reversed_keyboard_rows()
+    test_row_that_is_also_a_walk()
+    test_keyboard_walks()
+    test_keyboard_reporting_order()
+    test_keyboard_first_occurrence_only()
+    test_step_runs()
+    test_sequential_patterns()
+    test_sequential_pattern_order()
+    test_non_ascii_digit_sequence()
+    test_sequence_repeat_regex()
+    test_sequence_repetition()
+    test_character_and_sequence_repetition()
+    test_plain_common_word()
+    test_leetspeak_common_word()
+    test_plain_match_takes_precedence()
+    test_ambiguous_substitutes()
+    test_leetspeak_common_word_in_results()
+    test_empty_password()
+    test_batch_matches_single()
+    test_cached_detection()
+    print("✓ All tests passed!")